@@ -11,6 +11,38 @@
 namespace py = pybind11;
 using namespace pybind11::literals;
 
+/**
+ * Moves a vector into a numpy array without copying the data; the
+ * capsule keeps the vector alive for the lifetime of the array.
+ */
+static py::array_t<double> as_pyarray(std::vector<double> &&vec)
+{
+     auto data = new std::vector<double>(std::move(vec));
+     auto capsule = py::capsule(data, [](void *p)
+                                { delete reinterpret_cast<std::vector<double> *>(p); });
+     return py::array_t<double>(data->size(), data->data(), capsule);
+}
+
+/**
+ * Packs a vector of equally sized rows into a 2d numpy array with a
+ * single pass instead of building nested Python lists.
+ */
+static py::array_t<double> as_pyarray_2d(const std::vector<std::vector<double>> &rows)
+{
+     size_t nrow = rows.size();
+     size_t ncol = nrow ? rows.at(0).size() : 0;
+     py::array_t<double> result({nrow, ncol});
+     auto buf = result.mutable_unchecked<2>();
+     for (size_t i = 0; i < nrow; i++)
+     {
+          for (size_t j = 0; j < ncol; j++)
+          {
+               buf(i, j) = rows.at(i).at(j);
+          }
+     }
+     return result;
+}
+
 PYBIND11_MODULE(levin, m)
 {
      m.doc() = "Compute integrals with Levin's method.";
@@ -23,6 +55,9 @@ PYBIND11_MODULE(levin, m)
          .def("init_integral", &Levin::init_integral,
               "x"_a, "integrand"_a, "logx1"_a, "logy1"_a,
               py::call_guard<py::gil_scoped_release>())
+         .def("init_integral_weighted", &Levin::init_integral_weighted,
+              "x"_a, "integrand"_a, "weight"_a, "logx1"_a, "logy1"_a,
+              py::call_guard<py::gil_scoped_release>())
          .def("init_w_ell", &Levin::init_w_ell,
               "ell"_a, "w_ell"_a,
               py::call_guard<py::gil_scoped_release>())
@@ -62,10 +97,43 @@ PYBIND11_MODULE(levin, m)
          .def("cquad_integrate", &Levin::cquad_integrate,
               "limits"_a,
               py::call_guard<py::gil_scoped_release>())
-         .def("cquad_integrate_single_well", &Levin::cquad_integrate_single_well,
-              "limits"_a, "m_mode"_a,
-              py::call_guard<py::gil_scoped_release>())
+         .def("cquad_integrate_single_well", [](Levin &self, std::vector<double> limits, uint m_mode)
+              {
+                   std::vector<double> result;
+                   {
+                        py::gil_scoped_release release;
+                        result = self.cquad_integrate_single_well(limits, m_mode);
+                   }
+                   return as_pyarray(std::move(result)); },
+              "limits"_a, "m_mode"_a)
+         .def("cquad_integrate_single_well_batch", [](Levin &self, std::vector<std::vector<double>> limits)
+              {
+                   std::vector<double> result;
+                   {
+                        py::gil_scoped_release release;
+                        result = self.cquad_integrate_single_well_batch(limits);
+                   }
+                   return as_pyarray(std::move(result)); },
+              "limits"_a)
+         .def("cquad_integrate_single_well_stack", [](Levin &self, std::vector<double> x, std::vector<std::vector<std::vector<double>>> integrand, bool logx1, bool logy1, std::vector<double> limits, uint m_mode)
+              {
+                   std::vector<std::vector<double>> result;
+                   {
+                        py::gil_scoped_release release;
+                        result = self.cquad_integrate_single_well_stack(x, integrand, logx1, logy1, limits, m_mode);
+                   }
+                   return as_pyarray_2d(result); },
+              "x"_a, "integrand"_a, "logx1"_a, "logy1"_a, "limits"_a, "m_mode"_a)
          .def("cquad_integrate_double_well", &Levin::cquad_integrate_double_well,
               "limits"_a, "m_mode"_a, "n_mode"_a,
-              py::call_guard<py::gil_scoped_release>());
+              py::call_guard<py::gil_scoped_release>())
+         .def("cquad_integrate_double_well_batch", [](Levin &self, std::vector<std::vector<double>> limits, std::vector<uint> m_modes, std::vector<uint> n_modes)
+              {
+                   std::vector<std::vector<double>> result;
+                   {
+                        py::gil_scoped_release release;
+                        result = self.cquad_integrate_double_well_batch(limits, m_modes, n_modes);
+                   }
+                   return as_pyarray_2d(result); },
+              "limits"_a, "m_modes"_a, "n_modes"_a);
 }
\ No newline at end of file
@@ -178,6 +178,18 @@ void Levin::init_integral(std::vector<double> x, std::vector<std::vector<double>
     }
 }
 
+void Levin::init_integral_weighted(std::vector<double> x, std::vector<std::vector<double>> integrand, std::vector<double> weight, bool logx1, bool logy1)
+{
+    for (uint i = 0; i < x.size(); i++)
+    {
+        for (uint a = 0; a < integrand.at(i).size(); a++)
+        {
+            integrand.at(i).at(a) *= weight.at(i);
+        }
+    }
+    init_integral(x, integrand, logx1, logy1);
+}
+
 std::vector<double> Levin::get_w_ell(std::vector<double> ell, uint m_mode)
 {
     std::vector<double> result(ell.size());
@@ -1223,6 +1235,27 @@ std::vector<double> Levin::cquad_integrate_single_well(std::vector<double> limit
     return result;
 }
 
+std::vector<std::vector<double>> Levin::cquad_integrate_single_well_batch(std::vector<std::vector<double>> limits)
+{
+    std::vector<std::vector<double>> result(limits.size());
+    for (uint m_mode = 0; m_mode < limits.size(); m_mode++)
+    {
+        result.at(m_mode) = cquad_integrate_single_well(limits.at(m_mode), m_mode);
+    }
+    return result;
+}
+
+std::vector<std::vector<double>> Levin::cquad_integrate_single_well_stack(std::vector<double> x, std::vector<std::vector<std::vector<double>>> integrand, bool logx1, bool logy1, std::vector<double> limits, uint m_mode)
+{
+    std::vector<std::vector<double>> result(integrand.size());
+    for (uint i_stack = 0; i_stack < integrand.size(); i_stack++)
+    {
+        init_integral(x, integrand.at(i_stack), logx1, logy1);
+        result.at(i_stack) = cquad_integrate_single_well(limits, m_mode);
+    }
+    return result;
+}
+
 double Levin::cquad_integrand_double_well(double x, void *p)
 {
     uint tid = omp_get_thread_num();
@@ -1266,6 +1299,30 @@ std::vector<double> Levin::cquad_integrate_double_well(std::vector<double> limit
     return result;
 }
 
+std::vector<std::vector<double>> Levin::cquad_integrate_double_well_batch(std::vector<std::vector<double>> limits, std::vector<uint> m_modes, std::vector<uint> n_modes)
+{
+    int_index_integral = new uint[N_thread_max];
+    std::vector<std::vector<double>> result(m_modes.size());
+#pragma omp parallel for
+    for (uint i_pair = 0; i_pair < m_modes.size(); i_pair++)
+    {
+        uint tid = omp_get_thread_num();
+        result.at(i_pair) = std::vector<double>(number_integrals, 0.0);
+        for (uint i = 0; i < number_integrals; i++)
+        {
+            int_index_integral[tid] = i;
+            int_m_mode[tid] = m_modes.at(i_pair);
+            int_n_mode[tid] = n_modes.at(i_pair);
+            for (uint j = 0; j < limits.at(i_pair).size() - 1; j++)
+            {
+                result.at(i_pair).at(i) += gslIntegratecquad(cquad_integrand_double_well, limits.at(i_pair).at(j), limits.at(i_pair).at(j + 1));
+            }
+        }
+    }
+    delete int_index_integral;
+    return result;
+}
+
 double Levin::cov_R_Gaussian_integrand(double k, void *p)
 {
     uint tid = omp_get_thread_num();
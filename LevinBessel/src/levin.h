@@ -128,6 +128,12 @@ public:
    */
   void init_integral(std::vector<double> x, std::vector<std::vector<double>> integrand, bool logx1, bool logy1);
 
+  /**
+   * Same as init_integral, but multiplies every integrand by the per-x weight
+   * before splining, avoiding the broadcasted temporary on the caller side.
+   */
+  void init_integral_weighted(std::vector<double> x, std::vector<std::vector<double>> integrand, std::vector<double> weight, bool logx1, bool logy1);
+
   void init_w_ell(std::vector<double> ell, std::vector<std::vector<double>> w_ells);
 
   std::vector<double> get_w_ell(std::vector<double> ell, uint m_mode);
@@ -259,9 +265,15 @@ public:
 
   std::vector<double> cquad_integrate_single_well(std::vector<double> limits, uint m_mode);
 
+  std::vector<std::vector<double>> cquad_integrate_single_well_batch(std::vector<std::vector<double>> limits);
+
+  std::vector<std::vector<double>> cquad_integrate_single_well_stack(std::vector<double> x, std::vector<std::vector<std::vector<double>>> integrand, bool logx1, bool logy1, std::vector<double> limits, uint m_mode);
+
   static double cquad_integrand_double_well(double x, void *p);
 
   std::vector<double> cquad_integrate_double_well(std::vector<double> limits, uint m_mode, uint n_mode);
+
+  std::vector<std::vector<double>> cquad_integrate_double_well_batch(std::vector<std::vector<double>> limits, std::vector<uint> m_modes, std::vector<uint> n_modes);
   
   static double integrand(double x, void *p);
 
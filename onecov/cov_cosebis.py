@@ -1,7 +1,6 @@
 import time
 import numpy as np
-from scipy.signal import argrelextrema
-from scipy.interpolate import UnivariateSpline
+from scipy.interpolate import PchipInterpolator
 
 import levin
 
@@ -163,14 +162,23 @@ class CovCOSEBI(CovELLSpace):
         self.wn_ells, self.wn_kernels = \
             self.__get_wn_kernels(read_in_tables['COSEBIs'])
         self.ell_limits = []
+        kernel_diff = np.diff(np.array(self.wn_kernels), axis=1)
+        is_minimum = (kernel_diff[:, :-1] < 0) & (kernel_diff[:, 1:] >= 0)
         for mode in range(self.En_modes):
-            limits_at_mode = np.array(self.wn_ells[argrelextrema(self.wn_kernels[mode], np.less)[0][:]])[::20]
+            minima = np.where(is_minimum[mode])[0] + 1
+            limits_at_mode = np.geomspace(
+                self.wn_ells[minima[0]], self.wn_ells[minima[-1]], max(8, mode + 4))
             limits_at_mode_append = np.zeros(len(limits_at_mode) + 2)
             limits_at_mode_append[1:-1] = limits_at_mode
             limits_at_mode_append[0] = self.wn_ells[0]
             limits_at_mode_append[-1] = self.wn_ells[-1]
             self.ell_limits.append(limits_at_mode_append)
-        
+        self.ell_limits_offsets = np.cumsum(
+            [0] + [len(limits) for limits in self.ell_limits])
+        self.ell_limits_flat = np.concatenate(self.ell_limits)
+        self.ell_limits = [self.ell_limits_flat[self.ell_limits_offsets[mode]:self.ell_limits_offsets[mode + 1]]
+                           for mode in range(self.En_modes)]
+
         self.levin_int = levin.Levin(0, 16, 32, obs_dict['COSEBIs']['En_acc']/np.sqrt(len(self.ell_limits[0][:])), self.integration_intervals)
         self.levin_int.init_w_ell(self.wn_ells, np.array(self.wn_kernels).T)
         
@@ -190,12 +198,33 @@ class CovCOSEBI(CovELLSpace):
                              survey_params_dict,
                              prec,
                              read_in_tables)
-        self.theta_integral = np.geomspace(obs_dict['COSEBIs']['theta_min'], obs_dict['COSEBIs']['theta_max'], 1000) 
+        self._ellrange_col = self.ellrange[:, None]
+        self.cov_dtype = np.float32
+        self._gauss_tile_length = 512
+        self._emode_layout = []
+        offset = 0
+        for tracer, flat_length in [('mm', self.sample_dim*self.sample_dim*self.n_tomo_lens**2),
+                                    ('gm', self.sample_dim*self.sample_dim*self.n_tomo_lens*self.n_tomo_clust),
+                                    ('gg', self.sample_dim*self.sample_dim*self.n_tomo_clust**2)]:
+            if getattr(self, tracer):
+                self._emode_layout.append(
+                    (tracer, slice(offset, offset + flat_length)))
+                offset += flat_length
+        self.theta_integral = np.geomspace(obs_dict['COSEBIs']['theta_min'], obs_dict['COSEBIs']['theta_max'], 1000)
         self.dnpair_gg, self.dnpair_gm, self.dnpair_mm, self.theta_gg, self.theta_gm, self.theta_mm  = self.get_dnpair([self.gg, self.gm, self.mm],
                                                                                                                         self.theta_integral,
                                                                                                                         survey_params_dict,
                                                                                                                         read_in_tables['npair'])
-        
+        self._Tn_pm_at_theta = {}
+        evaluated_grids = {}
+        for tracer, theta in (('gg', self.theta_gg), ('gm', self.theta_gm), ('mm', self.theta_mm)):
+            if theta is None:
+                continue
+            grid_key = theta.tobytes()
+            if grid_key not in evaluated_grids:
+                evaluated_grids[grid_key] = (self.Tn_p(theta), self.Tn_m(theta))
+            self._Tn_pm_at_theta[tracer] = evaluated_grids[grid_key]
+
         if self.cov_dict['gauss']:
             self.E_mode_gg, self.E_mode_gm, self.E_mode_mm = self.calc_E_mode()
 
@@ -218,12 +247,9 @@ class CovCOSEBI(CovELLSpace):
     def __get_Tn_pm(self,
                     cosebi_tabs,
                     covCOSEBIsettings):
-        self.Tn_p = []
-        self.Tn_m = []
         if cosebi_tabs['Tn_p'] is not None:
-            for i_mode in range(len(cosebi_tabs['Tn_p'][:,0])):
-                self.Tn_p.append(UnivariateSpline(cosebi_tabs['Tn_pm_theta'],  cosebi_tabs['Tn_p'][i_mode,:], k=2, s=0, ext=0))
-                self.Tn_m.append(UnivariateSpline(cosebi_tabs['Tn_pm_theta'],  cosebi_tabs['Tn_m'][i_mode,:], k=2, s=0, ext=0))
+            self.Tn_p = PchipInterpolator(cosebi_tabs['Tn_pm_theta'], cosebi_tabs['Tn_p'].T, axis=0, extrapolate=True)
+            self.Tn_m = PchipInterpolator(cosebi_tabs['Tn_pm_theta'], cosebi_tabs['Tn_m'].T, axis=0, extrapolate=True)
             if cosebi_tabs['Tn_pm_theta'][0] > covCOSEBIsettings['theta_min'] or cosebi_tabs['Tn_pm_theta'][-1] < covCOSEBIsettings['theta_max']:
                 print("Warning: To calculate the shot noise contribution for COSEBI "+
                     "I will have to extrapolate Tn_pm. "+
@@ -237,6 +263,26 @@ class CovCOSEBI(CovELLSpace):
                         "external table. Must be included in [tabulated inputs " +
                         "files] as 'Tn_plus_file' and 'Tn_minus_file' to go on.")
 
+    def __sn_integral_all_modes(self,
+                                theta,
+                                Tpm_product_all,
+                                dnpair):
+        """
+        Integrates the shot-noise kernel over theta for all mode pairs
+        at once. The trapezoidal rule is expressed through its quadrature
+        weights and contracted against the inverse pair counts with a
+        single matrix product, so no
+        (En_modes, En_modes, n_theta, n_tomo, n_tomo) intermediate is
+        ever materialized.
+        """
+        theta_weights = np.empty_like(theta)
+        theta_weights[0] = (theta[1] - theta[0])/2.
+        theta_weights[-1] = (theta[-1] - theta[-2])/2.
+        theta_weights[1:-1] = (theta[2:] - theta[:-2])/2.
+        return np.tensordot(Tpm_product_all*theta**2,
+                            theta_weights[:, None, None]/dnpair,
+                            axes=([2], [0]))/self.arcmin2torad2**2
+
     def calc_E_mode(self):
         """
         Calculates the E-mode signal of the COSEBis in all tomographic bin
@@ -265,63 +311,22 @@ class CovCOSEBI(CovELLSpace):
         E_mode_gg = np.zeros((self.En_modes, self.sample_dim,
                               self.n_tomo_clust, self.n_tomo_clust))
         
-        if (self.mm or self.gm):
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes
-            original_shape = self.Cell_mm[0, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_lens**2
-            Cell_mm_flat = np.reshape(self.Cell_mm, (len(
-                self.ellrange), flat_length))
-            for mode in range(self.En_modes):
-                self.levin_int.init_integral(self.ellrange, Cell_mm_flat*self.ellrange[:,None], True, True)
-                E_mode_mm[mode,:,:,:] = 1 / 2 / np.pi * np.reshape(np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[mode][:], mode)),original_shape)
-                eta = (time.time()-t0)/60 * (tcombs/tcomb-1)
-                print('\rCOSEBI E-mode calculation for lensing at '
-                        + str(round(tcomb/tcombs*100, 1)) + '% in '
-                        + str(round(((time.time()-t0)/60), 1)) +
-                        'min  ETA '
-                        'in ' + str(round(eta, 1)) + 'min', end="")
-                tcomb += 1
-            print(" ")
-
-        if (self.gm or (self.gg and self.mm and self.cross_terms)):
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes
-            original_shape = self.Cell_gm[0, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_lens*self.n_tomo_clust
-            Cell_gm_flat = np.reshape(self.Cell_gm, (len(
-                self.ellrange), flat_length))
-            for mode in range(self.En_modes):
-                self.levin_int.init_integral(self.ellrange, Cell_gm_flat*self.ellrange[:,None], True, True)
-                E_mode_gm[mode,:,:,:] = 1 / 2 / np.pi * np.reshape(np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[mode][:], mode)),original_shape)
-                eta = (time.time()-t0)/60 * (tcombs/tcomb-1)
-                print('\rCOSEBI E-mode calculation for GGL at '
-                        + str(round(tcomb/tcombs*100, 1)) + '% in '
-                        + str(round(((time.time()-t0)/60), 1)) +
-                        'min  ETA '
-                        'in ' + str(round(eta, 1)) + 'min', end="")
-                tcomb += 1
-                
-            print(" ")
-
-        if (self.gg or self.gm):
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes
-            original_shape = self.Cell_gg[0, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_clust**2
-            Cell_gg_flat = np.reshape(self.Cell_gg, (len(
-                self.ellrange), flat_length))
-            for mode in range(self.En_modes):
-                self.levin_int.init_integral(self.ellrange, Cell_gg_flat*self.ellrange[:,None], True, True)
-                E_mode_gg[mode,:,:,:] = 1 / 2 / np.pi * np.reshape(np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[mode][:], mode)),original_shape)
-                eta = (time.time()-t0)/60 * (tcombs/tcomb-1)
-                print('\rCOSEBI E-mode calculation for clustering at '
-                        + str(round(tcomb/tcombs*100, 1)) + '% in '
-                        + str(round(((time.time()-t0)/60), 1)) +
-                        'min  ETA '
-                        'in ' + str(round(eta, 1)) + 'min', end="")
-                tcomb += 1
-            print(" ")
+        Cells = {'mm': self.Cell_mm, 'gm': self.Cell_gm, 'gg': self.Cell_gg}
+        E_modes = {'mm': E_mode_mm, 'gm': E_mode_gm, 'gg': E_mode_gg}
+
+        if self._emode_layout:
+            t0 = time.time()
+            Cell_all_flat = np.concatenate(
+                [Cells[tracer].reshape(len(self.ellrange), -1).astype(np.float32)
+                 for tracer, _ in self._emode_layout], axis=1)
+            self.levin_int.init_integral_weighted(self.ellrange, Cell_all_flat, self.ellrange, True, True)
+            result_at_modes = np.asarray(self.levin_int.cquad_integrate_single_well_batch(
+                [self.ell_limits[mode][:] for mode in range(self.En_modes)]))
+            for tracer, tracer_slice in self._emode_layout:
+                np.multiply(np.reshape(result_at_modes[:, tracer_slice], E_modes[tracer].shape),
+                            1 / 2 / np.pi, out=E_modes[tracer])
+            print('COSEBI E-mode calculation finished in '
+                  + str(round(((time.time()-t0)/60), 1)) + 'min')
 
         return E_mode_gg, E_mode_gm, E_mode_mm
 
@@ -563,6 +568,63 @@ class CovCOSEBI(CovELLSpace):
                 gaussCOSEBImmgm_sva, gaussCOSEBImmgm_mix, gaussCOSEBImmgm_sn, \
                 gaussCOSEBImmmm_sva, gaussCOSEBImmmm_mix, gaussCOSEBImmmm_sn
 
+    def __gauss_cosebi_block(self,
+                             gaussELL_sva,
+                             gaussELL_mix,
+                             original_shape,
+                             survey_area,
+                             name):
+        """
+        Projects one Gaussian ell-space block onto all COSEBI mode pairs.
+
+        Runs the batched Levin double-well integration for the sva (and,
+        if given, mix) integrand and returns the symmetrized
+        (En_modes, En_modes) + original_shape covariance tensors. The mix
+        entry is returned as the scalar 0 when no mix integrand exists.
+        """
+        t0 = time.time()
+        flat_length = int(np.prod(original_shape))
+        scale = 1./2./np.pi/(survey_area/self.deg2torad2)
+        pairs = [(m_mode, n_mode) for m_mode in range(self.En_modes)
+                 for n_mode in range(m_mode, self.En_modes)]
+        pair_limits = [self.ell_limits[m_mode][:] for m_mode, _ in pairs]
+        pair_m = [m_mode for m_mode, _ in pairs]
+        pair_n = [n_mode for _, n_mode in pairs]
+        diags = []
+        for gaussELL in (gaussELL_sva, gaussELL_mix):
+            if gaussELL is None:
+                continue
+            gaussELL_flat = np.reshape(gaussELL, (len(self.ellrange), len(
+                self.ellrange), flat_length))
+            diags.append(
+                np.einsum('iij->ij', gaussELL_flat)*self._ellrange_col)
+        diag = np.concatenate(diags, axis=1)
+        batch = np.empty((len(pairs), diag.shape[1]))
+        for start in range(0, diag.shape[1], self._gauss_tile_length):
+            diag_tile = np.ascontiguousarray(
+                diag[:, start:start + self._gauss_tile_length])
+            self.levin_int.init_integral(
+                self.ellrange, diag_tile, True, True)
+            batch[:, start:start + self._gauss_tile_length] = \
+                self.levin_int.cquad_integrate_double_well_batch(
+                    pair_limits, pair_m, pair_n)
+        batch *= scale
+        results = []
+        for i_diag in range(len(diags)):
+            part = batch[:, i_diag*flat_length:(i_diag + 1)*flat_length]
+            cov = np.empty((self.En_modes, self.En_modes) + original_shape,
+                           dtype=self.cov_dtype)
+            for i_pair, (m_mode, n_mode) in enumerate(pairs):
+                cov[m_mode, n_mode] = np.reshape(part[i_pair], original_shape)
+                cov[n_mode, m_mode] = cov[m_mode, n_mode]
+            results.append(cov)
+        if gaussELL_mix is None:
+            results.append(0)
+        print('COSEBI E-mode covariance calculation for the ' + name +
+              ' term finished in '
+              + str(round(((time.time()-t0)/60), 1)) + 'min')
+        return results[0], results[1]
+
     def __covCOSEBI_split_gaussian(self,
                                    obs_dict,
                                    survey_params_dict):
@@ -640,51 +702,31 @@ class CovCOSEBI(CovELLSpace):
         gaussCOSEBImmmm_mix = None
         gaussCOSEBImmmm_sn = None
 
-        if self.gg or self.gm:
-            kron_delta_tomo_clust = np.diag(np.ones(self.n_tomo_clust))
-        if self.mm or self.gm:
-            kron_delta_tomo_lens = np.diag(np.ones(self.n_tomo_lens))
-
         if self.gg:
-            gaussCOSEBIgggg_sva = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust))
-            gaussCOSEBIgggg_mix = np.zeros_like(gaussCOSEBIgggg_sva)
+            original_shape = (self.sample_dim, self.sample_dim,
+                              self.n_tomo_clust, self.n_tomo_clust,
+                              self.n_tomo_clust, self.n_tomo_clust)
+            gaussCOSEBIgggg_sva, gaussCOSEBIgggg_mix = \
+                self.__gauss_cosebi_block(gaussELLgggg_sva, gaussELLgggg_mix,
+                                          original_shape,
+                                          survey_params_dict['survey_area_clust'],
+                                          'gggg')
             gaussCOSEBIgggg_sn = np.zeros_like(gaussCOSEBIgggg_sva)
-            original_shape = gaussCOSEBIgggg_sva[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_clust**4
-            gaussELL_sva_flat = np.reshape(gaussELLgggg_sva, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            gaussELL_mix_flat = np.reshape(gaussELLgggg_mix, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_sva_flat)*self.ellrange,0,-1), True, True)
-                    gaussCOSEBIgggg_sva[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_params_dict['survey_area_clust']/self.deg2torad2) * np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBIgggg_sva[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBIgggg_sva[m_mode, n_mode, :, :, :, :, :, :]
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_mix_flat)*self.ellrange,0,-1), True, True)
-                    gaussCOSEBIgggg_mix[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_params_dict['survey_area_clust']/self.deg2torad2) * np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBIgggg_mix[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBIgggg_mix[m_mode, n_mode, :, :, :, :, :, :]
-                    eta = (time.time()-t0) / \
-                        60 * (tcombs/tcomb-1)
-                    Tpm_product = self.Tn_p[m_mode](self.theta_gg)*self.Tn_p[n_mode](self.theta_gg) + self.Tn_m[m_mode](self.theta_gg)*self.Tn_m[n_mode](self.theta_gg)
-                    integrand = (Tpm_product*self.theta_gg**2)[:,None, None]/self.dnpair_gg
-                    aux_gg_sn = np.trapz(integrand,self.theta_gg,axis=0)/self.arcmin2torad2**2
-                    gaussCOSEBIgggg_sn[n_mode, m_mode, :, :, :, :, :, :] = (kron_delta_tomo_clust[None, None, :, None, :, None]
-                                                                            * kron_delta_tomo_clust[None, None, None, :, None, :]
-                                                                            + kron_delta_tomo_clust[None, None, :, None, None, :]
-                                                                            * kron_delta_tomo_clust[None, None, None, :, :, None]) \
-                                                                            * (np.ones(self.n_tomo_clust)[None, :]**2*np.ones(self.n_tomo_clust)[:, None]**2*aux_gg_sn)[None, None, :, :, None, None]/4.
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'gggg term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-
-            print(" ")
+            Tn_p_at_theta, Tn_m_at_theta = self._Tn_pm_at_theta['gg']
+            Tpm_product_all = Tn_p_at_theta.T[:, None, :]*Tn_p_at_theta.T[None, :, :] \
+                + Tn_m_at_theta.T[:, None, :]*Tn_m_at_theta.T[None, :, :]
+            aux_gg_sn_all = self.__sn_integral_all_modes(
+                self.theta_gg, Tpm_product_all, self.dnpair_gg)
+            tril_rows, tril_cols = np.tril_indices(self.En_modes)
+            tomo_clust = np.arange(self.n_tomo_clust)
+            aux_vals = aux_gg_sn_all[tril_cols[:, None, None], tril_rows[:, None, None],
+                                     tomo_clust[None, :, None], tomo_clust[None, None, :]][..., None, None]/4.
+            gaussCOSEBIgggg_sn[tril_rows[:, None, None], tril_cols[:, None, None], :, :,
+                               tomo_clust[None, :, None], tomo_clust[None, None, :],
+                               tomo_clust[None, :, None], tomo_clust[None, None, :]] = aux_vals
+            gaussCOSEBIgggg_sn[tril_rows[:, None, None], tril_cols[:, None, None], :, :,
+                               tomo_clust[None, :, None], tomo_clust[None, None, :],
+                               tomo_clust[None, None, :], tomo_clust[None, :, None]] += aux_vals
         else:
             gaussCOSEBIgggg_sva = 0
             gaussCOSEBIgggg_mix = 0
@@ -692,111 +734,56 @@ class CovCOSEBI(CovELLSpace):
 
         if self.gg and self.gm and self.cross_terms:
             gaussCOSEBIgggm_sn = 0
-            gaussCOSEBIgggm_sva = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_lens))
-            gaussCOSEBIgggm_mix = np.zeros_like(gaussCOSEBIgggm_sva)
-            original_shape = gaussCOSEBIgggm_sva[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_lens*self.n_tomo_clust**3
-            gaussELL_sva_flat = np.reshape(gaussELLgggm_sva, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            gaussELL_mix_flat = np.reshape(gaussELLgggm_mix, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_sva_flat)*self.ellrange,0,-1), True, True)
-                    survey_area = max(survey_params_dict['survey_area_clust'],survey_params_dict['survey_area_ggl'])   
-                    gaussCOSEBIgggm_sva[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_area/self.deg2torad2) * np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBIgggm_sva[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBIgggm_sva[m_mode, n_mode, :, :, :, :, :, :]
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_mix_flat)*self.ellrange,0,-1), True, True)
-                    gaussCOSEBIgggm_mix[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_area/self.deg2torad2) * np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBIgggm_mix[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBIgggm_mix[m_mode, n_mode, :, :, :, :, :, :]
-                    eta = (time.time()-t0) / \
-                        60 * (tcombs/tcomb-1)
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'gggm term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            print(" ")
+            original_shape = (self.sample_dim, self.sample_dim,
+                              self.n_tomo_clust, self.n_tomo_clust,
+                              self.n_tomo_clust, self.n_tomo_lens)
+            survey_area = max(survey_params_dict['survey_area_clust'],survey_params_dict['survey_area_ggl'])
+            gaussCOSEBIgggm_sva, gaussCOSEBIgggm_mix = \
+                self.__gauss_cosebi_block(gaussELLgggm_sva, gaussELLgggm_mix,
+                                          original_shape, survey_area, 'gggm')
         else:
             gaussCOSEBIgggm_sva = 0
             gaussCOSEBIgggm_mix = 0
             gaussCOSEBIgggm_sn = 0
 
         if self.gg and self.mm and self.cross_terms:
-            gaussCOSEBIggmm_sva = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_lens, self.n_tomo_lens))
-            gaussCOSEBIggmm_mix = 0
             gaussCOSEBIggmm_sn = 0
-            original_shape = gaussCOSEBIggmm_sva[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_lens**2*self.n_tomo_clust**2
-            gaussELL_sva_flat = np.reshape(gaussELLggmm_sva, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_sva_flat)*self.ellrange,0,-1), True, True)
-                    survey_area = max(survey_params_dict['survey_area_clust'],survey_params_dict['survey_area_lens'])
-                    gaussCOSEBIggmm_sva[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_area/self.deg2torad2) *  np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBIggmm_sva[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBIggmm_sva[m_mode, n_mode, :, :, :, :, :, :]
-                    eta = (time.time()-t0) / \
-                        60 * (tcombs/tcomb-1)
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'ggmm term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            print(" ")
+            original_shape = (self.sample_dim, self.sample_dim,
+                              self.n_tomo_clust, self.n_tomo_clust,
+                              self.n_tomo_lens, self.n_tomo_lens)
+            survey_area = max(survey_params_dict['survey_area_clust'],survey_params_dict['survey_area_lens'])
+            gaussCOSEBIggmm_sva, gaussCOSEBIggmm_mix = \
+                self.__gauss_cosebi_block(gaussELLggmm_sva, None,
+                                          original_shape, survey_area, 'ggmm')
         else:
             gaussCOSEBIggmm_sva = 0
             gaussCOSEBIggmm_mix = 0
             gaussCOSEBIggmm_sn = 0
 
         if self.gm:
-            gaussCOSEBIgmgm_sva = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_clust, self.n_tomo_lens, self.n_tomo_clust, self.n_tomo_lens))
-            gaussCOSEBIgmgm_mix = np.zeros_like(gaussCOSEBIgmgm_sva)
+            original_shape = (self.sample_dim, self.sample_dim,
+                              self.n_tomo_clust, self.n_tomo_lens,
+                              self.n_tomo_clust, self.n_tomo_lens)
+            gaussCOSEBIgmgm_sva, gaussCOSEBIgmgm_mix = \
+                self.__gauss_cosebi_block(gaussELLgmgm_sva, gaussELLgmgm_mix,
+                                          original_shape,
+                                          survey_params_dict['survey_area_ggl'],
+                                          'gmgm')
             gaussCOSEBIgmgm_sn = np.zeros_like(gaussCOSEBIgmgm_sva)
-            original_shape = gaussCOSEBIgmgm_sva[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_lens**2*self.n_tomo_lens**2
-            gaussELL_sva_flat = np.reshape(gaussELLgmgm_sva, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            gaussELL_mix_flat = np.reshape(gaussELLgmgm_mix, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_sva_flat)*self.ellrange,0,-1), True, True)
-                    gaussCOSEBIgmgm_sva[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_params_dict['survey_area_ggl']/self.deg2torad2) * np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBIgmgm_sva[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBIgmgm_sva[m_mode, n_mode, :, :, :, :, :, :]
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_mix_flat)*self.ellrange,0,-1), True, True)
-                    gaussCOSEBIgmgm_mix[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_params_dict['survey_area_ggl']/self.deg2torad2) * np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBIgmgm_mix[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBIgmgm_mix[m_mode, n_mode, :, :, :, :, :, :]
-                    eta = (time.time()-t0) / \
-                        60 * (tcombs/tcomb-1)
-                    Tpm_product = self.Tn_p[m_mode](self.theta_gm)*self.Tn_p[n_mode](self.theta_gm) + self.Tn_m[m_mode](self.theta_gm)*self.Tn_m[n_mode](self.theta_gm)
-                    integrand = (Tpm_product*self.theta_gm**2)[:,None, None]/self.dnpair_gm
-                    aux_gm_sn = np.trapz(integrand,self.theta_gm,axis=0)/self.arcmin2torad2**2
-                    gaussCOSEBIgmgm_sn[n_mode, m_mode, :, :, :, :, :, :] = (kron_delta_tomo_clust[None, None, :, None, :, None]
-                                                                            * kron_delta_tomo_lens[None, None, None, :, None, :]) \
-                                                                            * (survey_params_dict['ellipticity_dispersion'][None, :]**2*aux_gm_sn)[None, None, :, :, None, None]/2.
-                    
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'gmgm term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            print("")
+            Tn_p_at_theta, Tn_m_at_theta = self._Tn_pm_at_theta['gm']
+            Tpm_product_all = Tn_p_at_theta.T[:, None, :]*Tn_p_at_theta.T[None, :, :] \
+                + Tn_m_at_theta.T[:, None, :]*Tn_m_at_theta.T[None, :, :]
+            aux_gm_sn_all = self.__sn_integral_all_modes(
+                self.theta_gm, Tpm_product_all, self.dnpair_gm)
+            tril_rows, tril_cols = np.tril_indices(self.En_modes)
+            tomo_clust = np.arange(self.n_tomo_clust)
+            tomo_lens = np.arange(self.n_tomo_lens)
+            aux_vals = (survey_params_dict['ellipticity_dispersion'][None, None, :]**2
+                        * aux_gm_sn_all[tril_cols[:, None, None], tril_rows[:, None, None],
+                                        tomo_clust[None, :, None], tomo_lens[None, None, :]])[..., None, None]/2.
+            gaussCOSEBIgmgm_sn[tril_rows[:, None, None], tril_cols[:, None, None], :, :,
+                               tomo_clust[None, :, None], tomo_lens[None, None, :],
+                               tomo_clust[None, :, None], tomo_lens[None, None, :]] = aux_vals
         else:
             gaussCOSEBIgmgm_sva = 0
             gaussCOSEBIgmgm_mix = 0
@@ -804,83 +791,44 @@ class CovCOSEBI(CovELLSpace):
 
         if self.gm and self.mm and self.cross_terms:
             gaussCOSEBImmgm_sn = 0
-            gaussCOSEBImmgm_sva = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_lens, self.n_tomo_lens, self.n_tomo_clust, self.n_tomo_lens))
-            gaussCOSEBImmgm_mix = np.zeros_like(gaussCOSEBImmgm_sva)
-            original_shape = gaussCOSEBImmgm_sva[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_lens**3*self.n_tomo_clust
-            gaussELL_sva_flat = np.reshape(gaussELLmmgm_sva, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            gaussELL_mix_flat = np.reshape(gaussELLmmgm_mix, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_sva_flat)*self.ellrange,0,-1), True, True)
-                    survey_area = max(survey_params_dict['survey_area_ggl'],survey_params_dict['survey_area_lens'])
-                    gaussCOSEBImmgm_sva[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_area/self.deg2torad2) * np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBImmgm_sva[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBImmgm_sva[m_mode, n_mode, :, :, :, :, :, :]
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_mix_flat)*self.ellrange,0,-1), True, True)
-                    gaussCOSEBImmgm_mix[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_area/self.deg2torad2) * np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBImmgm_mix[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBImmgm_mix[m_mode, n_mode, :, :, :, :, :, :]
-                    eta = (time.time()-t0) / \
-                        60 * (tcombs/tcomb-1)
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'mmgm term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            print("")
+            original_shape = (self.sample_dim, self.sample_dim,
+                              self.n_tomo_lens, self.n_tomo_lens,
+                              self.n_tomo_clust, self.n_tomo_lens)
+            survey_area = max(survey_params_dict['survey_area_ggl'],survey_params_dict['survey_area_lens'])
+            gaussCOSEBImmgm_sva, gaussCOSEBImmgm_mix = \
+                self.__gauss_cosebi_block(gaussELLmmgm_sva, gaussELLmmgm_mix,
+                                          original_shape, survey_area, 'mmgm')
         else:
             gaussCOSEBImmgm_sva = 0
             gaussCOSEBImmgm_mix = 0
             gaussCOSEBImmgm_sn = 0
 
         if self.mm:
-            gaussCOSEBImmmm_sva = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_lens, self.n_tomo_lens, self.n_tomo_lens, self.n_tomo_lens))
-            gaussCOSEBImmmm_mix = np.zeros_like(gaussCOSEBImmmm_sva)
+            original_shape = (self.sample_dim, self.sample_dim,
+                              self.n_tomo_lens, self.n_tomo_lens,
+                              self.n_tomo_lens, self.n_tomo_lens)
+            gaussCOSEBImmmm_sva, gaussCOSEBImmmm_mix = \
+                self.__gauss_cosebi_block(gaussELLmmmm_sva, gaussELLmmmm_mix,
+                                          original_shape,
+                                          survey_params_dict['survey_area_lens'],
+                                          'mmmm')
             gaussCOSEBImmmm_sn = np.zeros_like(gaussCOSEBImmmm_sva)
-            original_shape = gaussCOSEBImmmm_sva[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_lens**4
-            gaussELL_sva_flat = np.reshape(gaussELLmmmm_sva, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            gaussELL_mix_flat = np.reshape(gaussELLmmmm_mix, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_sva_flat)*self.ellrange,0,-1), True, True)
-                    gaussCOSEBImmmm_sva[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_params_dict['survey_area_lens']/self.deg2torad2) * np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBImmmm_sva[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBImmmm_sva[m_mode, n_mode, :, :, :, :, :, :]
-                    self.levin_int.init_integral(self.ellrange, np.moveaxis(np.diagonal(gaussELL_mix_flat)*self.ellrange,0,-1), True, True)
-                    gaussCOSEBImmmm_mix[m_mode, n_mode, :, :, :, :, :, :] = 1./2./np.pi/(survey_params_dict['survey_area_lens']/self.deg2torad2) * np.reshape(np.array(self.levin_int.cquad_integrate_double_well(self.ell_limits[m_mode][:], m_mode, n_mode)),original_shape)
-                    gaussCOSEBImmmm_mix[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBImmmm_mix[m_mode, n_mode, :, :, :, :, :, :]
-                    eta = (time.time()-t0) / \
-                        60 * (tcombs/tcomb-1)
-                    Tpm_product = self.Tn_p[m_mode](self.theta_mm)*self.Tn_p[n_mode](self.theta_mm) + self.Tn_m[m_mode](self.theta_mm)*self.Tn_m[n_mode](self.theta_mm)
-                    integrand = (Tpm_product*self.theta_mm**2)[:,None, None]/self.dnpair_mm
-                    aux_mm_sn = np.trapz(integrand,self.theta_mm,axis=0)/self.arcmin2torad2**2
-                    gaussCOSEBImmmm_sn[m_mode, n_mode, :, :, :, :, :, :] = (kron_delta_tomo_lens[None, None, :, None, :, None]
-                                                                            * kron_delta_tomo_lens[None, None, None, :, None, :]
-                                                                            + kron_delta_tomo_lens[None, None, :, None, None, :]
-                                                                            * kron_delta_tomo_lens[None, None, None, :, :, None]) \
-                                                                            * (survey_params_dict['ellipticity_dispersion']**2)[None, None, :, None, None, None] \
-                                                                            * (survey_params_dict['ellipticity_dispersion']**2)[None, None, None, :, None, None] \
-                                                                            * aux_mm_sn[None, None, :, :, None, None]/2.
-                    gaussCOSEBImmmm_sn[n_mode, m_mode, :, :, :, :, :, :] = gaussCOSEBImmmm_sn[m_mode, n_mode, :, :, :, :, :, :] 
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'mmmm term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            print("")
+            Tn_p_at_theta, Tn_m_at_theta = self._Tn_pm_at_theta['mm']
+            Tpm_product_all = Tn_p_at_theta.T[:, None, :]*Tn_p_at_theta.T[None, :, :] \
+                + Tn_m_at_theta.T[:, None, :]*Tn_m_at_theta.T[None, :, :]
+            aux_mm_sn_all = self.__sn_integral_all_modes(
+                self.theta_mm, Tpm_product_all, self.dnpair_mm)
+            tomo_lens = np.arange(self.n_tomo_lens)
+            sigma2 = survey_params_dict['ellipticity_dispersion']**2
+            aux_vals = (sigma2[None, None, :, None]*sigma2[None, None, None, :]
+                        * aux_mm_sn_all)[..., None, None]/2.
+            mode_rows = np.arange(self.En_modes)
+            gaussCOSEBImmmm_sn[mode_rows[:, None, None, None], mode_rows[None, :, None, None], :, :,
+                               tomo_lens[None, None, :, None], tomo_lens[None, None, None, :],
+                               tomo_lens[None, None, :, None], tomo_lens[None, None, None, :]] = aux_vals
+            gaussCOSEBImmmm_sn[mode_rows[:, None, None, None], mode_rows[None, :, None, None], :, :,
+                               tomo_lens[None, None, :, None], tomo_lens[None, None, None, :],
+                               tomo_lens[None, None, None, :], tomo_lens[None, None, :, None]] += aux_vals
         else:
             gaussCOSEBImmmm_sva = 0
             gaussCOSEBImmmm_mix = 0
@@ -934,6 +882,71 @@ class CovCOSEBI(CovELLSpace):
                                                   tri_tab,
                                                   False)          
 
+    def __project_4pt_block(self,
+                            nongaussELL,
+                            flat_length,
+                            block_shape,
+                            survey_area,
+                            connected,
+                            name,
+                            outer_logy1=True):
+        """
+        Projects one non-Gaussian (or SSC) ell-space block onto the
+        COSEBI modes.
+
+        Carries out the nested Levin single-well integrations for every
+        mode pair on the upper triangle and mirrors the result. The mode
+        pairs are independent and the heavy lifting happens inside the
+        OpenMP-parallel Levin batch calls, so the Python loop only
+        sequences the pairs.
+        """
+        assert flat_length == int(np.prod(block_shape)), \
+            'flat_length does not match the tomographic block shape'
+        nongaussCOSEBI = np.zeros(
+            (self.En_modes, self.En_modes) + block_shape, dtype=self.cov_dtype)
+        original_shape = block_shape
+        nongaussELL_flat = np.reshape(nongaussELL, (len(self.ellrange), len(
+            self.ellrange), flat_length))
+        nongaussELL_flat = nongaussELL_flat*self.ellrange[:, None, None]
+        nongaussELL_stack = np.ascontiguousarray(
+            np.transpose(nongaussELL_flat, (1, 0, 2)))
+        scale = 1.0/(4.0*np.pi**2)
+        if connected:
+            scale /= (survey_area / self.deg2torad2)
+        t0, tcomb = time.time(), 1
+        tcombs = self.En_modes*(self.En_modes + 1)/2
+        self._log_interval = max(1, int(tcombs)//50)
+        inner_integrals = []
+        for n_mode in range(self.En_modes):
+            inner_integral = np.asarray(self.levin_int.cquad_integrate_single_well_stack(
+                self.ellrange, nongaussELL_stack, True, True,
+                self.ell_limits[n_mode][:], n_mode))
+            inner_integral *= self._ellrange_col
+            inner_integrals.append(inner_integral)
+        for m_mode in range(self.En_modes):
+            for n_mode in range(m_mode, self.En_modes):
+                self.levin_int.init_integral(
+                    self.ellrange, inner_integrals[n_mode], True, outer_logy1)
+                result = np.asarray(self.levin_int.cquad_integrate_single_well(
+                    self.ell_limits[m_mode][:], m_mode))
+                result *= scale
+                nongaussCOSEBI[m_mode, n_mode, :, :, :, :, :, :] = \
+                    np.reshape(result, original_shape)
+                nongaussCOSEBI[n_mode, m_mode, :, :, :, :, :, :] = \
+                    nongaussCOSEBI[m_mode, n_mode, :, :, :, :, :, :]
+                if tcomb % self._log_interval == 0:
+                    eta = (time.time()-t0) / \
+                            60 * (tcombs/tcomb-1)
+                    print('\rCOSEBI E-mode covariance calculation for the '
+                            + name + ' term '
+                            + str(round(tcomb/tcombs*100, 1)) + '% in '
+                            + str(round(((time.time()-t0)/60), 1)) +
+                            'min  ETA '
+                            'in ' + str(round(eta, 1)) + 'min', end="")
+                tcomb += 1
+        print("")
+        return nongaussCOSEBI
+
     def __covCOSEBI_4pt_projection(self,
                                obs_dict,
                                survey_params_dict,
@@ -959,210 +972,72 @@ class CovCOSEBI(CovELLSpace):
                 bias_dict, hod_dict, prec, survey_params_dict, obs_dict['ELLspace'])
         
 
-        if self.gg:
-            nongaussCOSEBIgggg = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust))
-            original_shape = nongaussCOSEBIgggg[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_clust**4
-            nongaussELL_flat = np.reshape(nongaussELLgggg, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    inner_integral = np.zeros((len(self.ellrange), flat_length))
-                    for i_ell in range(len(self.ellrange)):
-                        self.levin_int.init_integral(self.ellrange, nongaussELL_flat[:, i_ell, :]*self.ellrange[:, None], True, True)
-                        inner_integral[i_ell, :] = np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[n_mode][:], n_mode))
-                    self.levin_int.init_integral(self.ellrange, inner_integral*self.ellrange[:, None], True, True)
-                    nongaussCOSEBIgggg[m_mode, n_mode, :, :, :, :, :, :] = 1.0/(4.0*np.pi**2)*np.reshape(np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[m_mode][:], m_mode)),original_shape)
-                    nongaussCOSEBIgggg[n_mode, m_mode, :, :, :, :, :, :] = nongaussCOSEBIgggg[m_mode, n_mode, :, :, :, :, :, :]
-                    if connected:
-                        nongaussCOSEBIgggg[n_mode, m_mode, :, :, :, :, :, :] /= (survey_params_dict['survey_area_clust'] / self.deg2torad2)
-                    eta = (time.time()-t0) / \
-                            60 * (tcombs/tcomb-1)
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'nonGaussian gggg term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            
-            print("")
+        if self.gg and self.n_tomo_clust:
+            nongaussCOSEBIgggg = self.__project_4pt_block(
+                nongaussELLgggg,
+                self.sample_dim*self.sample_dim*self.n_tomo_clust**4,
+                (self.sample_dim, self.sample_dim, self.n_tomo_clust,
+                 self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust),
+                survey_params_dict['survey_area_clust'],
+                connected, 'nonGaussian gggg')
         else:
             nongaussCOSEBIgggg = 0
-            
 
-        if self.gg and self.gm and self.cross_terms:
-            nongaussCOSEBIgggm = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust))
-            original_shape = nongaussCOSEBIgggm[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_clust**3*self.n_tomo_lens
-            nongaussELL_flat = np.reshape(nongaussELLgggm, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    inner_integral = np.zeros((len(self.ellrange), flat_length))
-                    for i_ell in range(len(self.ellrange)):
-                        self.levin_int.init_integral(self.ellrange, nongaussELL_flat[:, i_ell, :]*self.ellrange[:, None], True, True)
-                        inner_integral[i_ell, :] = np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[n_mode][:], n_mode))
-                    self.levin_int.init_integral(self.ellrange, inner_integral*self.ellrange[:, None], True, True)
-                    nongaussCOSEBIgggm[m_mode, n_mode, :, :, :, :, :, :] = 1.0/(4.0*np.pi**2)*np.reshape(np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[m_mode][:], m_mode)),original_shape)
-                    nongaussCOSEBIgggm[n_mode, m_mode, :, :, :, :, :, :] = nongaussCOSEBIgggm[m_mode, n_mode, :, :, :, :, :, :]
-                    if connected:
-                        nongaussCOSEBIgggm[m_mode, n_mode, :, :, :, :, :, :] /= (max(survey_params_dict['survey_area_clust'],survey_params_dict['survey_area_ggl']) / self.deg2torad2)
-                    eta = (time.time()-t0) / \
-                            60 * (tcombs/tcomb-1)
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'nonGussian ggggm term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            
-            print("")
+        if self.gg and self.gm and self.cross_terms \
+                and self.n_tomo_clust and self.n_tomo_lens:
+            nongaussCOSEBIgggm = self.__project_4pt_block(
+                nongaussELLgggm,
+                self.sample_dim*self.sample_dim*self.n_tomo_clust**3*self.n_tomo_lens,
+                (self.sample_dim, self.sample_dim, self.n_tomo_clust,
+                 self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust),
+                max(survey_params_dict['survey_area_clust'],survey_params_dict['survey_area_ggl']),
+                connected, 'nonGussian ggggm')
         else:
             nongaussCOSEBIgggm = 0
 
-        if self.gg and self.mm and self.cross_terms:
-            nongaussCOSEBIggmm = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust))
-            original_shape = nongaussCOSEBIggmm[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_lens**2*self.n_tomo_clust**2
-            nongaussELL_flat = np.reshape(nongaussELLggmm, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    inner_integral = np.zeros((len(self.ellrange), flat_length))
-                    for i_ell in range(len(self.ellrange)):
-                        self.levin_int.init_integral(self.ellrange, nongaussELL_flat[:, i_ell, :]*self.ellrange[:, None], True, True)
-                        inner_integral[i_ell, :] = np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[n_mode][:], n_mode))
-                    self.levin_int.init_integral(self.ellrange, inner_integral*self.ellrange[:, None], True, True)
-                    nongaussCOSEBIggmm[m_mode, n_mode, :, :, :, :, :, :] = 1.0/(4.0*np.pi**2)*np.reshape(np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[m_mode][:], m_mode)),original_shape)
-                    nongaussCOSEBIggmm[n_mode, m_mode, :, :, :, :, :, :] = nongaussCOSEBIggmm[m_mode, n_mode, :, :, :, :, :, :]
-                    if connected:
-                        nongaussCOSEBIggmm[m_mode, n_mode, :, :, :, :, :, :] /= (max(survey_params_dict['survey_area_clust'],survey_params_dict['survey_area_lens']) / self.deg2torad2)
-                    eta = (time.time()-t0) / \
-                            60 * (tcombs/tcomb-1)
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'nonGussian ggmm term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            
-            print("")
+        if self.gg and self.mm and self.cross_terms \
+                and self.n_tomo_clust and self.n_tomo_lens:
+            nongaussCOSEBIggmm = self.__project_4pt_block(
+                nongaussELLggmm,
+                self.sample_dim*self.sample_dim*self.n_tomo_lens**2*self.n_tomo_clust**2,
+                (self.sample_dim, self.sample_dim, self.n_tomo_clust,
+                 self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust),
+                max(survey_params_dict['survey_area_clust'],survey_params_dict['survey_area_lens']),
+                connected, 'nonGussian ggmm')
         else:
             nongaussCOSEBIggmm = 0
 
-        if self.gm:
-            nongaussCOSEBIgmgm = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust))
-            original_shape = nongaussCOSEBIgmgm[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim**self.n_tomo_lens**2*self.n_tomo_clust**2
-            nongaussELL_flat = np.reshape(nongaussELLgmgm, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    inner_integral = np.zeros((len(self.ellrange), flat_length))
-                    for i_ell in range(len(self.ellrange)):
-                        self.levin_int.init_integral(self.ellrange, nongaussELL_flat[:, i_ell, :]*self.ellrange[:, None], True, True)
-                        inner_integral[i_ell, :] = np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[n_mode][:], n_mode))
-                    self.levin_int.init_integral(self.ellrange, inner_integral*self.ellrange[:, None], True, True)
-                    nongaussCOSEBIgmgm[m_mode, n_mode, :, :, :, :, :, :] = 1.0/(4.0*np.pi**2)*np.reshape(np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[m_mode][:], m_mode)),original_shape)
-                    nongaussCOSEBIgmgm[n_mode, m_mode, :, :, :, :, :, :] = nongaussCOSEBIgmgm[m_mode, n_mode, :, :, :, :, :, :]
-                    if connected: 
-                        nongaussCOSEBIgmgm[m_mode, n_mode, :, :, :, :, :, :] /= (survey_params_dict['survey_area_ggl']) / self.deg2torad2
-                    eta = (time.time()-t0) / \
-                            60 * (tcombs/tcomb-1)
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'nonGussian gmgm term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            
-            print("")
+        if self.gm and self.n_tomo_clust and self.n_tomo_lens:
+            nongaussCOSEBIgmgm = self.__project_4pt_block(
+                nongaussELLgmgm,
+                self.sample_dim*self.sample_dim*self.n_tomo_lens**2*self.n_tomo_clust**2,
+                (self.sample_dim, self.sample_dim, self.n_tomo_clust,
+                 self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust),
+                survey_params_dict['survey_area_ggl'],
+                connected, 'nonGussian gmgm')
         else:
             nongaussCOSEBIgmgm = 0
 
-        if self.gm and self.mm and self.cross_terms:
-            nongaussCOSEBImmgm = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust))
-            original_shape = nongaussCOSEBImmgm[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_lens**3*self.n_tomo_clust
-            nongaussELL_flat = np.reshape(nongaussELLmmgm, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    inner_integral = np.zeros((len(self.ellrange), flat_length))
-                    for i_ell in range(len(self.ellrange)):
-                        self.levin_int.init_integral(self.ellrange, nongaussELL_flat[:, i_ell, :]*self.ellrange[:, None], True, True)
-                        inner_integral[i_ell, :] = np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[n_mode][:], n_mode))
-                    self.levin_int.init_integral(self.ellrange, inner_integral*self.ellrange[:, None], True, False)
-                    nongaussCOSEBImmgm[m_mode, n_mode, :, :, :, :, :, :] = 1.0/(4.0*np.pi**2)*np.reshape(np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[m_mode][:], m_mode)),original_shape)
-                    nongaussCOSEBImmgm[n_mode, m_mode, :, :, :, :, :, :] = nongaussCOSEBImmgm[m_mode, n_mode, :, :, :, :, :, :]
-                    if connected:
-                        nongaussCOSEBImmgm[m_mode, n_mode, :, :, :, :, :, :] /= (max(survey_params_dict['survey_area_ggl'],survey_params_dict['survey_area_lens']) / self.deg2torad2)
-                    eta = (time.time()-t0) / \
-                            60 * (tcombs/tcomb-1)
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'nonGussian mmgm term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            
-            print("")
+        if self.gm and self.mm and self.cross_terms \
+                and self.n_tomo_clust and self.n_tomo_lens:
+            nongaussCOSEBImmgm = self.__project_4pt_block(
+                nongaussELLmmgm,
+                self.sample_dim*self.sample_dim*self.n_tomo_lens**3*self.n_tomo_clust,
+                (self.sample_dim, self.sample_dim, self.n_tomo_clust,
+                 self.n_tomo_clust, self.n_tomo_clust, self.n_tomo_clust),
+                max(survey_params_dict['survey_area_ggl'],survey_params_dict['survey_area_lens']),
+                connected, 'nonGussian mmgm', outer_logy1=False)
         else:
             nongaussCOSEBImmgm = 0
 
-        if self.mm:
-            nongaussCOSEBImmmm = np.zeros(
-                (self.En_modes, self.En_modes, self.sample_dim, self.sample_dim, self.n_tomo_lens, self.n_tomo_lens, self.n_tomo_lens, self.n_tomo_lens))
-            
-            original_shape = nongaussCOSEBImmmm[0, 0, :, :, :, :, :, :].shape
-            flat_length = self.sample_dim*self.sample_dim*self.n_tomo_lens**4
-            nongaussELL_flat = np.reshape(nongaussELLmmmm, (len(self.ellrange), len(
-                self.ellrange), flat_length))
-            t0, tcomb = time.time(), 1
-            tcombs = self.En_modes*(self.En_modes + 1)/2
-            for m_mode in range(self.En_modes):
-                for n_mode in range(m_mode, self.En_modes):
-                    inner_integral = np.zeros((len(self.ellrange), flat_length))
-                    for i_ell in range(len(self.ellrange)):
-                        self.levin_int.init_integral(self.ellrange, nongaussELL_flat[:, i_ell, :]*self.ellrange[:, None], True, True)
-                        inner_integral[i_ell, :] = np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[n_mode][:], n_mode))
-                    self.levin_int.init_integral(self.ellrange, inner_integral*self.ellrange[:, None], True, True)
-                    nongaussCOSEBImmmm[m_mode, n_mode, :, :, :, :, :, :] = 1.0/(4.0*np.pi**2)*np.reshape(np.array(self.levin_int.cquad_integrate_single_well(self.ell_limits[m_mode][:], m_mode)),original_shape)
-                    nongaussCOSEBImmmm[n_mode, m_mode, :, :, :, :, :, :] = nongaussCOSEBImmmm[m_mode, n_mode, :, :, :, :, :, :]
-                    if connected:
-                        nongaussCOSEBImmmm[m_mode, n_mode, :, :, :, :, :, :] /= (survey_params_dict['survey_area_lens'] / self.deg2torad2)
-                    eta = (time.time()-t0) / \
-                            60 * (tcombs/tcomb-1)
-                    print('\rCOSEBI E-mode covariance calculation for the '
-                            'nonGussian mmmm term '
-                            + str(round(tcomb/tcombs*100, 1)) + '% in '
-                            + str(round(((time.time()-t0)/60), 1)) +
-                            'min  ETA '
-                            'in ' + str(round(eta, 1)) + 'min', end="")
-                    tcomb += 1
-            
-            print("")
-            
+        if self.mm and self.n_tomo_lens:
+            nongaussCOSEBImmmm = self.__project_4pt_block(
+                nongaussELLmmmm,
+                self.sample_dim*self.sample_dim*self.n_tomo_lens**4,
+                (self.sample_dim, self.sample_dim, self.n_tomo_lens,
+                 self.n_tomo_lens, self.n_tomo_lens, self.n_tomo_lens),
+                survey_params_dict['survey_area_lens'],
+                connected, 'nonGussian mmmm')
         else:
             nongaussCOSEBImmmm = 0
 
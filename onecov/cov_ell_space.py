@@ -1594,11 +1594,11 @@ class CovELLSpace(PolySpectra):
             gaussELLmmmm_sva, gaussELLmmmm_mix, gaussELLmmmm_sn = 0, 0, 0
 
         if self.Cell_gg is not None and type(self.Cell_gg) is not int:
-            self.Cell_gg = self.Cell_gg[:, None, :, :]
+            self.Cell_gg = np.ascontiguousarray(self.Cell_gg[:, None, :, :])
         if self.Cell_gm is not None and type(self.Cell_gm) is not int:
-            self.Cell_gm = self.Cell_gm[:, None, :, :]
+            self.Cell_gm = np.ascontiguousarray(self.Cell_gm[:, None, :, :])
         if self.Cell_mm is not None and type(self.Cell_mm) is not int:
-            self.Cell_mm = self.Cell_mm[:, None, :, :]
+            self.Cell_mm = np.ascontiguousarray(self.Cell_mm[:, None, :, :])
 
         if self.mm or self.gm:
             if len(covELLspacesettings['mult_shear_bias']) < self.n_tomo_lens:
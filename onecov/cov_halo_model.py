@@ -1,5 +1,6 @@
 import numpy as np
-from scipy.interpolate import UnivariateSpline, RectBivariateSpline
+from scipy.interpolate import CubicSpline, InterpolatedUnivariateSpline, \
+    RectBivariateSpline
 from scipy.special import sici, erf
 from astropy import units as u
 
@@ -12,6 +13,84 @@ except:
     from cov_hod import HOD
 
 
+class _LogLinInterp:
+    """
+    Piecewise-linear interpolation of a table along a fixed grid.
+
+    Drop-in replacement for an interpolating UnivariateSpline of degree
+    one, including the linear extrapolation beyond the grid ends, but
+    without the FITPACK fitting overhead.
+
+    Parameters
+    ----------
+    grid : array
+        with shape (grid_bins)
+    table : array
+        with shape (grid_bins)
+
+    """
+
+    def __init__(self, grid, table):
+        self.grid = grid
+        self.table = table
+
+    def __call__(self, x):
+        scalar = np.ndim(x) == 0
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        result = np.interp(x, self.grid, self.table)
+        below = x < self.grid[0]
+        if np.any(below):
+            slope = (self.table[1] - self.table[0]) \
+                / (self.grid[1] - self.grid[0])
+            result[below] = \
+                self.table[0] + slope*(x[below] - self.grid[0])
+        above = x > self.grid[-1]
+        if np.any(above):
+            slope = (self.table[-1] - self.table[-2]) \
+                / (self.grid[-1] - self.grid[-2])
+            result[above] = \
+                self.table[-1] + slope*(x[above] - self.grid[-1])
+        return result[0] if scalar else result
+
+
+class _BiLinInterp:
+    """
+    Bilinear interpolation of a table on a fixed rectangular grid.
+
+    Drop-in replacement for a RectBivariateSpline with kx = ky = 1
+    evaluated on a grid, including the clamping to the edge values
+    beyond the grid, but with constant construction cost instead of a
+    FITPACK fit per table.
+
+    Parameters
+    ----------
+    gridx : array
+        with shape (gridx_bins)
+    gridy : array
+        with shape (gridy_bins)
+    table : array
+        with shape (gridx_bins, gridy_bins)
+
+    """
+
+    def __init__(self, gridx, gridy, table):
+        self.gridx = gridx
+        self.gridy = gridy
+        self.table = table
+
+    @staticmethod
+    def __interp_axis0(grid, table, x):
+        idx = np.clip(np.searchsorted(grid, x) - 1, 0, len(grid) - 2)
+        frac = np.clip((x - grid[idx]) / (grid[idx + 1] - grid[idx]), 0., 1.)
+        return table[idx] + frac[:, None]*(table[idx + 1] - table[idx])
+
+    def __call__(self, x, y):
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        tmp = self.__interp_axis0(self.gridx, self.table, x)
+        return self.__interp_axis0(self.gridy, tmp.T, y).T
+
+
 class HaloModel(Setup):
     """
     This class calculates the necessary ingredients of the halo model 
@@ -149,14 +228,28 @@ class HaloModel(Setup):
         
         self.mass_func = \
             self.calc_mass_func(zet, cosmo_dict, prec['hm'], prec['powspec'])
+        hm_prec_low = dict(prec['hm'])
+        hm_prec_low['log10M_min'] = 2.0
+        self._mass_func_low = \
+            self.calc_mass_func(zet, cosmo_dict, hm_prec_low, prec['powspec'])
         self.hod = HOD(bias_dict, prec['hm'])
+        self._occ_cache = {}
         self.ngal = self.nbar(hod_dict)
-        self.ncen = self.nbar_cen(hod_dict)
         self.nsat = self.nbar_sat(hod_dict)
+        self.ncen = self.ngal - self.nsat
+        if self.effbias_tab['bias'] is not None:
+            self._effbias_splines = [InterpolatedUnivariateSpline(
+                self.effbias_tab['z'],
+                self.effbias_tab['bias'][mbin, :], k=2)
+                for mbin in range(self.sample_dim)]
         self.norm_bias = -1
+        self._bias_cache = {}
+        self._einsum_paths = {}
+        self._uk_cache = {}
+        self._uk_cache_z = None
+        self._kdamp_cache = {}
         self.effective_bias = self.calc_effective_bias(
             bias_dict, hod_dict, prec['hm'])
-        self.calc_mass_func(0, cosmo_dict, prec['hm'],  prec['powspec'])
 
     def calc_mass_func(self,
                        zet,
@@ -228,6 +321,102 @@ class HaloModel(Setup):
 
         return mass_func
 
+    def __trap_weights(self,
+                       x):
+        """
+        Returns the trapezoidal quadrature weights for the grid x, so
+        that integrand @ weights equals np.trapz(integrand, x) along the
+        last axis with a single dot product instead of the diff/sum
+        passes np.trapz makes over the full integrand.
+
+        Parameters
+        ----------
+        x : array
+            with shape (M_bins)
+
+        Returns
+        -------
+        weights : array
+            with shape (M_bins)
+
+        """
+        weights = np.empty_like(x)
+        d = np.diff(x)
+        weights[0] = d[0]/2.
+        weights[-1] = d[-1]/2.
+        weights[1:-1] = (d[:-1] + d[1:])/2.
+        return weights
+
+    def __contract(self,
+                   subscripts,
+                   *operands):
+        """
+        Wrapper around np.einsum that caches the optimal contraction
+        path per subscript string and operand shapes, so repeated
+        halo-model integrals do not rediscover it on every call.
+
+        Parameters
+        ----------
+        subscripts : string
+            Einstein summation subscripts.
+        operands : arrays
+            Arrays to be contracted.
+
+        Returns
+        -------
+        contraction : array
+
+        """
+        key = (subscripts,) + tuple(op.shape for op in operands)
+        if key not in self._einsum_paths:
+            self._einsum_paths[key] = np.einsum_path(
+                subscripts, *operands, optimize='optimal')[0]
+        return np.einsum(subscripts, *operands,
+                         optimize=self._einsum_paths[key])
+
+    def __get_occ_num(self,
+                      hod_dict,
+                      pop):
+        """
+        Returns the expected occupation number < N_pop | M > for the
+        current HOD mass grid, caching the result so the table and
+        scatter-model evaluations inside the HOD class only run once
+        per grid.
+
+        Parameters
+        ----------
+        hod_dict : dictionary
+            Specifies all the information about the halo occupation
+            distribution used. To be passed from the read_input method
+            of the Input class.
+        pop : string
+            - "cen" for centrals
+            - "sat" for satellites
+            - "total" for centrals plus satellites
+
+        Returns
+        -------
+        occ_num : array
+            with shape (sample_bins, M_bins)
+
+        """
+        if pop == 'total':
+            return self.__get_occ_num(hod_dict, 'cen') \
+                + self.__get_occ_num(hod_dict, 'sat')
+        cache_key = (pop,
+                     len(self.hod.Mrange),
+                     float(self.hod.Mrange[0]),
+                     float(self.hod.Mrange[-1]))
+        if cache_key not in self._occ_cache:
+            self._occ_cache[cache_key] = \
+                self.hod.occ_num_and_prob_per_pop(
+                    hod_dict,
+                    pop,
+                    self.mor_tab,
+                    self.occprob_tab,
+                    self.occnum_tab)[0]
+        return self._occ_cache[cache_key]
+
     def nbar(self,
              hod_dict):
         """
@@ -251,14 +440,9 @@ class HaloModel(Setup):
             with shape (sample_bins)
 
         """
-        return np.trapz(self.mass_func.dndm
-                        * self.hod.occ_num_and_prob(
-                            hod_dict,
-                            self.mor_tab,
-                            self.occprob_tab,
-                            self.occnum_tab
-                        )[0],
-                        self.hod.Mrange[None, :])
+        return (self.mass_func.dndm
+                * self.__get_occ_num(hod_dict, 'total')) \
+            @ self.__trap_weights(self.hod.Mrange)
 
     def nbar_cen(self,
                  hod_dict):
@@ -306,15 +490,9 @@ class HaloModel(Setup):
             with unit 1 / (Mpc/h)^3
             with shape (sample_bins)
         """
-        return np.trapz(self.mass_func.dndm
-                        * self.hod.occ_num_and_prob_per_pop(
-                            hod_dict,
-                            'sat',
-                            self.mor_tab,
-                            self.occprob_tab,
-                            self.occnum_tab
-                        )[0],
-                        self.hod.Mrange[None, :])
+        return (self.mass_func.dndm
+                * self.__get_occ_num(hod_dict, 'sat')) \
+            @ self.__trap_weights(self.hod.Mrange)
 
     def __bias_tinker10_fittfunc(self,
                                  nu):
@@ -338,11 +516,12 @@ class HaloModel(Setup):
 
         """
         y = np.log10(self.mass_func.mdef_params['overdensity'])
-        A = 1 + 0.24*y*np.exp(-(4/y)**4)
+        expfac = np.exp(-(4/y)**4)
+        A = 1 + 0.24*y*expfac
         a = 0.44*y - 0.88
         B = 0.183
         b = 1.5
-        C = 0.019 + 0.107*y + 0.19*np.exp(-(4/y)**4)
+        C = 0.019 + 0.107*y + 0.19*expfac
         c = 2.4
 
         tinker = 1 \
@@ -384,30 +563,38 @@ class HaloModel(Setup):
         """
 
         if bias_dict['model'] == 'Tinker10':
-            step_save = self.mass_func.dlog10m
-            nu_save = self.mass_func.nu**0.5
-
-            norm_Mmin = 2.
-            norm_Mbins = 500.
+            if self.norm_bias == -1:
+                self._bias_cache = {}
+            cache_key = (self.mass_func.z,
+                         self.mass_func.mdef_params['overdensity'],
+                         self.mass_func.delta_c,
+                         len(self.mass_func.m),
+                         float(self.mass_func.m[0]),
+                         float(self.mass_func.m[-1]))
+            if cache_key in self._bias_cache:
+                return self._bias_cache[cache_key]
 
-            Mmin_new = norm_Mmin
-            step_new = (self.mass_func.Mmax - Mmin_new) / norm_Mbins
-            self.mass_func.update(Mmin=Mmin_new, dlog10m=step_new)
-            nu_new = self.mass_func.nu**0.5
             if self.norm_bias == -1:
+                step_save = self.mass_func.dlog10m
+                Mmin_save = float(np.log10(self.mass_func.m[0]))
+
+                norm_Mmin = 2.
+                norm_Mbins = 500.
+
+                step_new = (self.mass_func.Mmax - norm_Mmin) / norm_Mbins
+                self.mass_func.update(Mmin=norm_Mmin, dlog10m=step_new)
+                nu_new = self.mass_func.nu**0.5
                 self.norm_bias = \
                     np.trapz(self.mass_func.fsigma
                              / nu_new
                              * self.__bias_tinker10_fittfunc(nu_new),
                              nu_new)
-            spline_tinker = \
-                UnivariateSpline(nu_new, self.__bias_tinker10_fittfunc(nu_new),
-                                 k=2, s=0, ext=0)
-            tinker = spline_tinker(nu_save)
-            self.mass_func.update(Mmin=hm_prec['log10M_min'],
-                                  dlog10m=step_save)
-
-            return tinker / self.norm_bias
+                self.mass_func.update(Mmin=Mmin_save, dlog10m=step_save)
+
+            tinker = self.__bias_tinker10_fittfunc(self.mass_func.nu**0.5)
+
+            self._bias_cache[cache_key] = tinker / self.norm_bias
+            return self._bias_cache[cache_key]
         else:
             raise Exception("For now the only valid bias model is " +
                             "'Tinker10', sorry for the inconvenience, work in progress.")
@@ -446,28 +633,56 @@ class HaloModel(Setup):
         """
 
         if self.effbias_tab['bias'] is None:
-            occ_num = self.hod.occ_num_and_prob(
-                hod_dict,
-                self.mor_tab,
-                self.occprob_tab,
-                self.occnum_tab
-            )[0]
-            integral = np.trapz(self.mass_func.dndm
-                                * occ_num
-                                * self.bias(bias_dict, hm_prec),
-                                self.mass_func.m)
+            occ_num = self.__get_occ_num(hod_dict, 'total')
+            integral = (self.mass_func.dndm
+                        * occ_num
+                        * self.bias(bias_dict, hm_prec)) \
+                @ self.__trap_weights(self.mass_func.m)
 
             bias = integral / self.ngal
         else:
             bias = np.zeros(self.sample_dim)
             for mbin in range(self.sample_dim):
-                bias_2dspline = UnivariateSpline(
-                    self.effbias_tab['z'],
-                    self.effbias_tab['bias'][mbin, :], k=2, s=0)
-                bias[mbin] = bias_2dspline(self.mass_func.z)
+                bias[mbin] = self._effbias_splines[mbin](self.mass_func.z)
 
         return bias
 
+    def __sici_tail(self,
+                    x):
+        """
+        Evaluates the sine and cosine integrals like
+        scipy.special.sici, but switches to the asymptotic expansions
+        Si(x) = pi/2 - f(x)cos(x) - g(x)sin(x) and
+        Ci(x) = f(x)sin(x) - g(x)cos(x) with f, g expanded through
+        x^-7 for x >= 25, where they agree with the full evaluation to
+        better than 1e-8. Saves the expensive special-function call on
+        the large-argument part of the (k, M) grid.
+
+        Parameters
+        ----------
+        x : array
+
+        Returns
+        -------
+        si, ci : arrays
+            with the shape of x
+
+        """
+        si = np.empty_like(x)
+        ci = np.empty_like(x)
+        tail = x >= 25.0
+        core = ~tail
+        si[core], ci[core] = sici(x[core])
+        xt = x[tail]
+        x2 = xt*xt
+        f = (1 - 2/x2 + 24/x2**2 - 720/x2**3)/xt
+        g = (1 - 6/x2 + 120/x2**2 - 5040/x2**3)/x2
+        sin_xt = np.sin(xt)
+        cos_xt = np.cos(xt)
+        si[tail] = np.pi/2 - f*cos_xt - g*sin_xt
+        ci[tail] = f*sin_xt - g*cos_xt
+        return si, ci
+
     def uk(self,
            Mc_relation):
         """
@@ -488,21 +703,46 @@ class HaloModel(Setup):
 
         """
 
+        if self._uk_cache_z != self.mass_func.z:
+            self._uk_cache = {}
+            self._uk_cache_z = self.mass_func.z
+        cache_key = (Mc_relation,
+                     len(self.mass_func.m),
+                     float(self.mass_func.m[0]),
+                     float(self.mass_func.m[-1]),
+                     len(self.mass_func.k))
+        if cache_key in self._uk_cache:
+            return self._uk_cache[cache_key]
+
         overdensity = self.mass_func.mdef_params['overdensity']
         con = self.__concentration(Mc_relation)
-        deltac = overdensity * con**3 / (3 * (np.log(1+con) - con/(1+con)))
+        deltac = overdensity * con**3 / (3 * (np.log1p(con) - con/(1+con)))
 
         rvir = self.__virial_radius()
         rs = rvir / con
+        prefac = 4*np.pi * self.rho_bg * deltac * rs**3 / self.mass_func.m
         # rsk[idx] gives all rs's for each k
         rsk = np.outer(self.mass_func.k, rs)
-        bsin, bcos = sici(rsk)
-        asin, acos = sici((1+con) * rsk)
-
-        u_k = 4*np.pi * self.rho_bg * deltac * rs**3 / self.mass_func.m \
-            * (np.sin(rsk) * (asin-bsin) - np.sin(con*rsk) / ((1+con)*rsk)
-               + np.cos(rsk) * (acos - bcos))
-
+        bsin, bcos = self.__sici_tail(rsk)
+        asin, acos = self.__sici_tail((1+con) * rsk)
+        # assemble sin(x)*(Si((1+c)x)-Si(x)) - sin(cx)/((1+c)x)
+        # + cos(x)*(Ci((1+c)x)-Ci(x)) in place, reusing the sici buffers
+        # as scratch to avoid further (log10k_bins, M_bins) temporaries
+        asin -= bsin
+        acos -= bcos
+        u_k = np.sin(rsk, out=bsin)
+        u_k *= asin
+        np.cos(rsk, out=bcos)
+        bcos *= acos
+        u_k += bcos
+        np.multiply(rsk, con, out=asin)
+        np.sin(asin, out=asin)
+        rsk *= 1 + con
+        asin /= rsk
+        u_k -= asin
+        u_k *= prefac
+
+        self._uk_cache[cache_key] = u_k
         return u_k
 
     def __virial_radius(self):
@@ -578,7 +818,11 @@ class HaloModel(Setup):
 
         """
         if mode == 'damped':
-            return erf(krange / scale)
+            cache_key = (len(krange), float(krange[0]), float(krange[-1]),
+                         scale)
+            if cache_key not in self._kdamp_cache:
+                self._kdamp_cache[cache_key] = erf(krange / scale)
+            return self._kdamp_cache[cache_key]
         elif mode == 'none':
             return np.ones_like(krange)
         else:
@@ -622,31 +866,24 @@ class HaloModel(Setup):
 
         """
 
-        # if type == 'sat'
-        uk = self.uk(bias_dict['Mc_relation_sat'])
         norm = self.ngal
-        pop = self.hod.occ_num_and_prob_per_pop(
-            hod_dict,
-            'sat',
-            self.mor_tab,
-            self.occprob_tab,
-            self.occnum_tab
-        )[0]
         if (type_x == 'cen'):
-            uk = np.ones_like(uk)
-            pop = self.hod.occ_num_and_prob_per_pop(
-                hod_dict,
-                'cen',
-                self.mor_tab,
-                self.occprob_tab,
-                self.occnum_tab
-            )[0]
-        if (type_x == 'm'):
+            uk = np.ones((len(self.mass_func.k), len(self.mass_func.m)))
+            pop = self.__get_occ_num(hod_dict, 'cen')
+        elif (type_x == 'm'):
             uk = self.uk(bias_dict['Mc_relation_cen'])
             norm = np.ones_like(norm) * self.rho_bg
             pop = self.mass_func.m
+        else:
+            uk = self.uk(bias_dict['Mc_relation_sat'])
+            pop = self.__get_occ_num(hod_dict, 'sat')
 
-        return (uk[:, None]*pop) / norm.T[:, None]
+        pop = np.atleast_2d(pop)
+        hurlyX = np.empty((uk.shape[0], len(norm), uk.shape[1]))
+        np.multiply(uk[:, None, :], pop[None, :, :], out=hurlyX)
+        hurlyX /= norm[None, :, None]
+
+        return hurlyX
 
     def hurly_x_spline_logk(self,
                             bias_dict,
@@ -662,21 +899,15 @@ class HaloModel(Setup):
 
         Returns
         -------
-        hurly_x : nested list of UnivariateSplines
-            with shape (sample_bins, M_bins)
+        hurly_x : CubicSpline
+            evaluates to an array with
+            shape (len(log10k), sample_bins, M_bins)
 
         """
         hurlyX = self.hurly_x(bias_dict, hod_dict, type_x)
 
-        hurly_shape = hurlyX.shape
-        hurlyX_spline = [[] for _ in range(hurly_shape[1])]
-        for nbin in range(hurly_shape[1]):
-            for idxM in range(hurly_shape[2]):
-                hurlyX_spline[nbin].append(UnivariateSpline(
-                    np.log10(self.mass_func.k),
-                    hurlyX[:, nbin, idxM], s=0, ext=0))
-
-        return hurlyX_spline
+        return CubicSpline(np.log10(self.mass_func.k), hurlyX,
+                           axis=0, extrapolate=True)
 
     def halo_model_integral_I_alpha_x(self,
                                       bias_dict,
@@ -729,29 +960,22 @@ class HaloModel(Setup):
                     self.hurly_x(bias_dict, hod_dict, 'cen') \
                     + self.hurly_x(bias_dict, hod_dict, 'sat')
                 bias = self.bias(bias_dict, hm_prec) * bias_dict['bias_2h']
-                integral_x = np.trapz(self.mass_func.dndm
-                                      * bias
-                                      * hurlyX,
-                                      self.mass_func.m)
+                integral_x = (self.mass_func.dndm
+                              * bias
+                              * hurlyX) \
+                    @ self.__trap_weights(self.mass_func.m)
             if type_x == 'm':
-                M_min_save = hm_prec["log10M_min"]
-                step_save = self.mass_func.dlog10m
-                Mmin = 2.0
-                hm_prec["log10M_min"] = Mmin
-                step = (self.mass_func.Mmax - Mmin) / hm_prec["M_bins"]
-                hm_prec['M_bins'] = len(self.mass_func.m)
-                self.mass_func.update(Mmin=Mmin, dlog10m=step)
-                self.hod.hod_update(bias_dict, hm_prec)
+                mass_func_save = self.mass_func
+                if self._mass_func_low.z != mass_func_save.z:
+                    self._mass_func_low.update(z=mass_func_save.z)
+                self.mass_func = self._mass_func_low
 
                 hurlyX = self.hurly_x(bias_dict, hod_dict, 'm')
                 bias = self.bias(bias_dict, hm_prec)
-                integral_x = np.trapz(
-                    self.mass_func.dndm * hurlyX * bias, self.mass_func.m)
+                integral_x = (self.mass_func.dndm * hurlyX * bias) \
+                    @ self.__trap_weights(self.mass_func.m)
 
-                hm_prec["log10M_min"] = M_min_save
-                self.mass_func.update(Mmin=M_min_save, dlog10m=step_save)
-                hm_prec['M_bins'] = len(self.mass_func.m)
-                self.hod.hod_update(bias_dict, hm_prec)
+                self.mass_func = mass_func_save
 
         return integral_x
 
@@ -771,24 +995,25 @@ class HaloModel(Setup):
 
         Returns
         -------
-        integralX_spline : list of UnivariateSplines
+        integralX_spline : list of _LogLinInterp
             with shape (sample_bins)
 
         """
 
-        integralX = np.log10(self.halo_model_integral_I_alpha_x(bias_dict,
-                                                                hod_dict,
-                                                                hm_prec,
-                                                                alpha,
-                                                                type_x))
+        integralX = self.halo_model_integral_I_alpha_x(bias_dict,
+                                                       hod_dict,
+                                                       hm_prec,
+                                                       alpha,
+                                                       type_x)
+        # floor at the smallest positive float so a vanishing integral
+        # cannot push -inf into the interpolation tables
+        integralX = np.log10(np.maximum(integralX, np.finfo(np.float64).tiny))
         integralX_shape = integralX.shape
 
+        logk = np.log10(self.mass_func.k)
         integralX_spline = []
         for nbin in range(integralX_shape[1]):
-            integralX_spline.append(
-                UnivariateSpline(np.log10(self.mass_func.k),
-                                 integralX[:, nbin],
-                                 k=1, s=0, ext=0))
+            integralX_spline.append(_LogLinInterp(logk, integralX[:, nbin]))
 
         return integralX_spline
 
@@ -846,63 +1071,54 @@ class HaloModel(Setup):
             integral_xy = 1
             hurlyX = 1
             hurlyY = 1
-            correct = 0
+            correct = None
             bias = 1
 
-            if type_x == 'g':
-                hurlyX = \
-                    self.hurly_x(bias_dict, hod_dict, 'cen') \
+            if type_x == 'g' or type_y == 'g':
+                hurly_cen = self.hurly_x(bias_dict, hod_dict, 'cen')
+                hurly_g = hurly_cen \
                     + self.hurly_x(bias_dict, hod_dict, 'sat')
+
+            if type_x == 'g':
+                hurlyX = hurly_g
                 bias = self.bias(bias_dict, hm_prec) * bias_dict['bias_2h']
             elif type_x == 'm':
                 hurlyX = self.hurly_x(bias_dict, hod_dict, 'm')
 
             if (type_y == 'g'):
-                hurlyY = \
-                    self.hurly_x(bias_dict, hod_dict, 'cen') \
-                    + self.hurly_x(bias_dict, hod_dict, 'sat')
+                hurlyY = hurly_g
                 bias = self.bias(bias_dict, hm_prec) * bias_dict['bias_2h']
             elif type_y == 'm':
                 hurlyY = self.hurly_x(bias_dict, hod_dict, 'm')
                 bias = self.bias(bias_dict, hm_prec)
 
             if type_x == 'g' and type_y == 'g':
-                correct = \
-                    self.hurly_x(
-                        bias_dict, hod_dict, 'cen')[:, None, :,  None, :] \
-                    * self.hurly_x(
-                        bias_dict, hod_dict, 'cen')[:, None, :, :]
+                correct = hurly_cen
                 bias = self.bias(bias_dict, hm_prec)
 
             if type_x == 'm' and type_y == 'm':
-                M_min_save = hm_prec["log10M_min"]
-                step_save = self.mass_func.dlog10m
-                Mmin = 2.0
-                hm_prec["log10M_min"] = Mmin
-                step = (self.mass_func.Mmax - Mmin) / hm_prec["M_bins"]
-                hm_prec['M_bins'] = len(self.mass_func.m)
-                self.mass_func.update(Mmin=Mmin, dlog10m=step)
-                self.hod.hod_update(bias_dict, hm_prec)
+                mass_func_save = self.mass_func
+                if self._mass_func_low.z != mass_func_save.z:
+                    self._mass_func_low.update(z=mass_func_save.z)
+                self.mass_func = self._mass_func_low
 
                 hurlyX = self.hurly_x(bias_dict, hod_dict, 'm')
                 bias = self.bias(bias_dict, hm_prec)
-                integral_xy = np.trapz(self.mass_func.dndm
-                                       * hurlyX[:, None, :,  None, :]
-                                       * hurlyX[:, None, :, :]
-                                       * bias,
-                                       self.mass_func.m)
-
-                hm_prec["log10M_min"] = M_min_save
-                self.mass_func.update(Mmin=M_min_save, dlog10m=step_save)
-                hm_prec['M_bins'] = len(self.mass_func.m)
-                self.hod.hod_update(bias_dict, hm_prec)
+                weights = self.__trap_weights(self.mass_func.m) \
+                    * self.mass_func.dndm * bias
+                integral_xy = self.__contract('ism,jtm,m->ijst',
+                                              hurlyX, hurlyX, weights)
+
+                self.mass_func = mass_func_save
             else:
-                integral_xy = np.trapz(self.mass_func.dndm
-                                       * (hurlyX[:, None, :,  None, :]
-                                          * hurlyY[:, None, :, :]
-                                          - correct)
-                                       * bias,
-                                       self.mass_func.m)
+                weights = self.__trap_weights(self.mass_func.m) \
+                    * self.mass_func.dndm * bias
+                integral_xy = self.__contract('ism,jtm,m->ijst',
+                                              hurlyX, hurlyY, weights)
+                if correct is not None:
+                    integral_xy -= self.__contract('ism,jtm,m->ijst',
+                                                   correct, correct,
+                                                   weights)
 
         return integral_xy
 
@@ -925,28 +1141,30 @@ class HaloModel(Setup):
 
         Returns
         -------
-        integralXY_spline : nested list of UnivariateSplines
+        integralXY_spline : nested list of _BiLinInterp
             with shape (sample_bins, sample_bins)
 
         """
 
-        integralXY = np.log10(self.halo_model_integral_I_alpha_xy(bias_dict,
-                                                                  hod_dict,
-                                                                  hm_prec,
-                                                                  alpha,
-                                                                  type_x,
-                                                                  type_y))
+        integralXY = self.halo_model_integral_I_alpha_xy(bias_dict,
+                                                         hod_dict,
+                                                         hm_prec,
+                                                         alpha,
+                                                         type_x,
+                                                         type_y)
+        # the central correction can cancel the integrand to zero or
+        # below; floor before the log so the tables stay finite
+        integralXY = \
+            np.log10(np.maximum(integralXY, np.finfo(np.float64).tiny))
 
         integralXY_shape = integralXY.shape
+        logk = np.log10(self.mass_func.k)
         integralXY_spline = []
         for nbin in range(integralXY_shape[2]):
             integralXY_spline.append([])
             for mbin in range(integralXY_shape[3]):
-                integralXY_spline[nbin].append(RectBivariateSpline(
-                    np.log10(self.mass_func.k),
-                    np.log10(self.mass_func.k),
-                    integralXY[:, :, nbin, mbin],
-                    kx=1, ky=1, s=0))
+                integralXY_spline[nbin].append(
+                    _BiLinInterp(logk, logk, integralXY[:, :, nbin, mbin]))
 
         return integralXY_spline
 
@@ -994,27 +1212,19 @@ class HaloModel(Setup):
         if alpha == 0:
             integral_mmm = 0
         else:
-            M_min_save = hm_prec["log10M_min"]
-            step_save = self.mass_func.dlog10m
-            Mmin = 2.0
-            hm_prec["log10M_min"] = Mmin
-            step = (self.mass_func.Mmax - Mmin) / hm_prec["M_bins"]
-            hm_prec['M_bins'] = len(self.mass_func.m)
-            self.mass_func.update(Mmin=Mmin, dlog10m=step)
-            self.hod.hod_update(bias_dict, hm_prec)
+            mass_func_save = self.mass_func
+            if self._mass_func_low.z != mass_func_save.z:
+                self._mass_func_low.update(z=mass_func_save.z)
+            self.mass_func = self._mass_func_low
 
             hurlyX = self.hurly_x(bias_dict, hod_dict, 'm')
             bias = self.bias(bias_dict, hm_prec)
-            integral_mmm = np.trapz(self.mass_func.dndm
-                                    * hurlyX[:, None, :, :]
-                                    * hurlyX**2.0
-                                    * bias,
-                                    self.mass_func.m)
+            weights = self.__trap_weights(self.mass_func.m) \
+                * self.mass_func.dndm * bias
+            integral_mmm = self.__contract('ism,jsm,m->ijs',
+                                           hurlyX, hurlyX**2.0, weights)
 
-            hm_prec["log10M_min"] = M_min_save
-            self.mass_func.update(Mmin=M_min_save, dlog10m=step_save)
-            hm_prec['M_bins'] = len(self.mass_func.m)
-            self.hod.hod_update(bias_dict, hm_prec)
+            self.mass_func = mass_func_save
 
         return integral_mmm
 
@@ -1039,13 +1249,16 @@ class HaloModel(Setup):
 
         """
 
-        integralmmm = np.log10(self.halo_model_integral_I_alpha_mmm(bias_dict,
-                                                                    hod_dict,
-                                                                    hm_prec,
-                                                                    alpha))
+        integralmmm = self.halo_model_integral_I_alpha_mmm(bias_dict,
+                                                           hod_dict,
+                                                           hm_prec,
+                                                           alpha)
+        integralmmm = \
+            np.log10(np.maximum(integralmmm, np.finfo(np.float64).tiny))
 
+        logk = np.log10(self.mass_func.k)
         return RectBivariateSpline(
-            np.log10(self.mass_func.k),
-            np.log10(self.mass_func.k),
+            logk,
+            logk,
             integralmmm[:, :, 0],
             kx=1, ky=1, s=0)
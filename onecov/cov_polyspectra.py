@@ -1342,19 +1342,11 @@ class PolySpectra(HaloModel):
             self.hurly_x_spline_logk(bias_dict, hod_dict, 'cen')
         hurly_s_spline = \
             self.hurly_x_spline_logk(bias_dict, hod_dict, 'sat')
-        hurly_c = np.zeros((k_dim, self.sample_dim, M_dim))
-        hurly_s = np.zeros((k_dim, self.sample_dim, M_dim))
         hurly_m_spline = \
             self.hurly_x_spline_logk(bias_dict, hod_dict, 'm')
-        hurly_m = np.zeros((k_dim, self.sample_dim, M_dim))
-        for nbin in range(self.sample_dim):
-            for idxM in range(M_dim):
-                hurly_c[:, nbin, idxM] = \
-                    hurly_c_spline[nbin][idxM](self.logks_tri)
-                hurly_s[:, nbin, idxM] = \
-                    hurly_s_spline[nbin][idxM](self.logks_tri)
-                hurly_m[:, nbin, idxM] = \
-                    hurly_m_spline[nbin][idxM](self.logks_tri)
+        hurly_c = hurly_c_spline(self.logks_tri)
+        hurly_s = hurly_s_spline(self.logks_tri)
+        hurly_m = hurly_m_spline(self.logks_tri)
 
         global T1h_allbutmmmm
 
@@ -1440,11 +1432,7 @@ class PolySpectra(HaloModel):
             M_dim = len(self.mass_func.m)
 
             hurly_m_spline = self.hurly_x_spline_logk(bias_dict, hod_dict, 'm')
-            hurly_m = np.zeros((k_dim, self.sample_dim, M_dim))
-            for nbin in range(self.sample_dim):
-                for idxM in range(M_dim):
-                    hurly_m[:, nbin, idxM] = \
-                        hurly_m_spline[nbin][idxM](self.logks_tri)
+            hurly_m = hurly_m_spline(self.logks_tri)
 
             global T1h_mmmm
 